@@ -9,13 +9,21 @@ from pydantic import BaseModel, Field
 
 from config import Settings
 from learning import LearningEngine, LearningResult
-from memory import SQLiteMemoryStore
+from memory import MemoryRecord, SQLiteMemoryStore
 from prompts import build_judgment_input, build_response_input, format_conversation, format_memories
 from user_model import render_user_model
 
 
 logger = logging.getLogger(__name__)
 
+INTENT_KEYWORDS = (
+    ("reflection", ("think about me", "מי אני", "מה אתה יודע", "איך אתה רואה אותי")),
+    ("emotion", ("feel", "רגיש", "כואב", "קשה לי", "מפחד", "sad", "anxious")),
+    ("strategy", ("should i", "what should", "מה כדאי", "איך נכון", "strategy", "plan")),
+)
+QUESTION_PREFIXES = ("what ", "why ", "how ", "מה ", "למה ", "איך ")
+LIVE_DATA_KEYWORDS = ("today", "latest", "now", "currently", "news", "weather", "stock", "price", "היום", "עכשיו", "עדכני")
+
 
 class JudgmentResult(BaseModel):
     intent: Literal["facts", "advice", "reflection", "strategy", "emotion", "update", "mixed", "other"]
@@ -33,12 +41,12 @@ class BenjaminBrain:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.memory = SQLiteMemoryStore(settings.database_path, primary_user_id=settings.primary_user_id)
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = OpenAI(api_key=settings.openai_api_key, timeout=settings.openai_timeout_seconds)
         self.learning_engine = LearningEngine(
             client=self.client,
             model=settings.openai_analysis_model,
-            timeout_seconds=settings.openai_timeout_seconds,
         )
+        self._background_tasks: set[asyncio.Task[None]] = set()
 
     async def ensure_user_profile(self, user_id: str, display_name: str | None = None) -> dict[str, Any]:
         canonical_user_id = self._canonical_user_id(user_id)
@@ -47,38 +55,34 @@ class BenjaminBrain:
     async def reply(self, *, user_id: str, display_name: str | None, message_text: str) -> str:
         canonical_user_id = self._canonical_user_id(user_id)
         profile = await self.ensure_user_profile(canonical_user_id, display_name)
-        await asyncio.to_thread(
-            self.memory.log_conversation,
+        recent_conversation, relevant_memories = await asyncio.to_thread(
+            self._record_and_recall,
             canonical_user_id,
-            "user",
             message_text,
-            metadata={"display_name": display_name or "", "telegram_user_id": user_id},
-        )
-
-        recent_conversation = await asyncio.to_thread(
-            self.memory.get_recent_conversation,
-            canonical_user_id,
-            limit=self.settings.recent_conversation_limit,
-        )
-        relevant_memories = await asyncio.to_thread(
-            self.memory.retrieve_relevant_memories,
-            canonical_user_id,
-            message_text,
-            limit=self.settings.relevant_memory_limit,
-            scan_limit=self.settings.max_memories_to_scan,
+            {"display_name": display_name or "", "telegram_user_id": user_id},
         )
 
         profile_summary = render_user_model(profile)
         memory_lines = format_memories(relevant_memories)
         conversation_text = format_conversation(recent_conversation)
 
-        judgment = await asyncio.to_thread(
-            self._judge,
-            profile_summary,
-            memory_lines,
-            conversation_text,
-            message_text,
-        )
+        try:
+            judgment = await asyncio.wait_for(
+                asyncio.to_thread(
+                    self._judge,
+                    profile_summary,
+                    memory_lines,
+                    conversation_text,
+                    message_text,
+                ),
+                timeout=self.settings.judgment_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Judgment timed out after %.1fs, falling back to heuristics",
+                self.settings.judgment_timeout_seconds,
+            )
+            judgment = self._heuristic_judgment(message_text)
 
         response_text = await asyncio.to_thread(
             self._generate_response,
@@ -97,22 +101,67 @@ class BenjaminBrain:
             metadata={"judgment": judgment.model_dump()},
         )
 
-        learning = await asyncio.to_thread(
-            self.learning_engine.learn,
-            profile_summary=profile_summary,
-            recent_conversation=conversation_text,
-            message_text=message_text,
-            assistant_response=response_text,
+        task = asyncio.create_task(
+            self._learn_from_turn(
+                canonical_user_id,
+                profile_summary,
+                conversation_text,
+                message_text,
+                response_text,
+            )
         )
-        await asyncio.to_thread(self._apply_learning, canonical_user_id, learning)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
         return response_text
 
+    async def finish_background_tasks(self) -> None:
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def _learn_from_turn(
+        self,
+        user_id: str,
+        profile_summary: str,
+        conversation_text: str,
+        message_text: str,
+        response_text: str,
+    ) -> None:
+        try:
+            learning = await asyncio.to_thread(
+                self.learning_engine.learn,
+                profile_summary=profile_summary,
+                recent_conversation=conversation_text,
+                message_text=message_text,
+                assistant_response=response_text,
+            )
+            await asyncio.to_thread(self._apply_learning, user_id, learning)
+        except Exception:
+            logger.exception("Failed to learn from conversation turn")
+
     def _canonical_user_id(self, user_id: str) -> str:
         if self.settings.single_user_mode:
             return self.settings.primary_user_id
         return user_id
 
+    def _record_and_recall(
+        self,
+        user_id: str,
+        message_text: str,
+        metadata: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], list[MemoryRecord]]:
+        self.memory.log_conversation(user_id, "user", message_text, metadata=metadata)
+        recent_conversation = self.memory.get_recent_conversation(
+            user_id,
+            limit=self.settings.recent_conversation_limit,
+        )
+        relevant_memories = self.memory.retrieve_relevant_memories(
+            user_id,
+            message_text,
+            limit=self.settings.relevant_memory_limit,
+            scan_limit=self.settings.max_memories_to_scan,
+        )
+        return recent_conversation, relevant_memories
+
     def _judge(
         self,
         profile_summary: str,
@@ -121,9 +170,10 @@ class BenjaminBrain:
         message_text: str,
     ) -> JudgmentResult:
         try:
-            response = self.client.with_options(timeout=self.settings.openai_timeout_seconds).responses.parse(
+            response = self.client.responses.parse(
                 model=self.settings.openai_analysis_model,
                 reasoning={"effort": "low"},
+                prompt_cache_key="benjamin-judgment",
                 input=build_judgment_input(
                     profile_summary=profile_summary,
                     memories=memory_lines,
@@ -147,9 +197,10 @@ class BenjaminBrain:
         judgment: JudgmentResult,
         message_text: str,
     ) -> str:
-        response = self.client.with_options(timeout=self.settings.openai_timeout_seconds).responses.create(
+        response = self.client.responses.create(
             model=self.settings.openai_model,
             reasoning={"effort": judgment.reasoning_effort},
+            prompt_cache_key="benjamin-response",
             input=build_response_input(
                 profile_summary=profile_summary,
                 memory_lines=memory_lines,
@@ -203,15 +254,13 @@ class BenjaminBrain:
     def _heuristic_judgment(self, message_text: str) -> JudgmentResult:
         stripped = message_text.strip()
         lowered = stripped.casefold()
-        intent = "other"
-        if "?" in stripped or lowered.startswith(("what ", "why ", "how ", "מה ", "למה ", "איך ")):
-            intent = "facts"
-        if any(token in lowered for token in ["should i", "what should", "מה כדאי", "איך נכון", "strategy", "plan"]):
-            intent = "strategy"
-        if any(token in lowered for token in ["feel", "רגיש", "כואב", "קשה לי", "מפחד", "sad", "anxious"]):
-            intent = "emotion"
-        if any(token in lowered for token in ["think about me", "מי אני", "מה אתה יודע", "איך אתה רואה אותי"]):
-            intent = "reflection"
+        for intent, keywords in INTENT_KEYWORDS:
+            if any(token in lowered for token in keywords):
+                break
+        else:
+            intent = "other"
+            if "?" in stripped or lowered.startswith(QUESTION_PREFIXES):
+                intent = "facts"
 
         response_depth = "balanced"
         if len(stripped) < 50:
@@ -223,10 +272,7 @@ class BenjaminBrain:
         if intent == "emotion":
             style = "warm"
 
-        needs_live_data = any(
-            token in lowered
-            for token in ["today", "latest", "now", "currently", "news", "weather", "stock", "price", "היום", "עכשיו", "עדכני"]
-        )
+        needs_live_data = any(token in lowered for token in LIVE_DATA_KEYWORDS)
 
         useful_truth = "Be honest, cut fluff, and focus on the real decision or tension."
         likely_need = "clarity"
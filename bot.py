@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from telegram import Update
 from telegram.constants import ChatAction
@@ -14,6 +16,7 @@ logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
+logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
@@ -67,9 +70,32 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
             logger.exception("Failed to send error recovery message")
 
 
+async def post_init(application: Application) -> None:
+    executor = ThreadPoolExecutor(max_workers=settings.thread_pool_size, thread_name_prefix="benjamin")
+    asyncio.get_running_loop().set_default_executor(executor)
+
+
+async def post_stop(application: Application) -> None:
+    brain: BenjaminBrain = application.bot_data["brain"]
+    await brain.finish_background_tasks()
+
+
+async def post_shutdown(application: Application) -> None:
+    brain: BenjaminBrain = application.bot_data["brain"]
+    brain.memory.close()
+
+
 def build_application() -> Application:
     settings.validate()
-    application = Application.builder().token(settings.telegram_token).concurrent_updates(True).build()
+    application = (
+        Application.builder()
+        .token(settings.telegram_token)
+        .concurrent_updates(True)
+        .post_init(post_init)
+        .post_stop(post_stop)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     application.bot_data["brain"] = BenjaminBrain(settings)
     application.add_handler(CommandHandler("start", start_command))
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
@@ -19,6 +19,7 @@ class Settings:
     openai_model: str
     openai_analysis_model: str
     openai_timeout_seconds: float
+    judgment_timeout_seconds: float
     database_path: Path
     bot_name: str
     default_user_name: str
@@ -28,6 +29,7 @@ class Settings:
     max_memories_to_scan: int
     primary_user_id: str
     single_user_mode: bool
+    thread_pool_size: int
 
     def validate(self) -> None:
         missing = []
@@ -48,6 +50,7 @@ def get_settings() -> Settings:
         openai_model=os.getenv("OPENAI_MODEL", "gpt-5.5").strip(),
         openai_analysis_model=os.getenv("OPENAI_ANALYSIS_MODEL", "").strip() or os.getenv("OPENAI_MODEL", "gpt-5.5").strip(),
         openai_timeout_seconds=float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60")),
+        judgment_timeout_seconds=float(os.getenv("JUDGMENT_TIMEOUT_SECONDS", "20")),
         database_path=Path(os.getenv("DATABASE_PATH", BASE_DIR / "benjamin_memory.db")).expanduser(),
         bot_name=os.getenv("BOT_NAME", "Benjamin").strip(),
         default_user_name=os.getenv("DEFAULT_USER_NAME", "מתן").strip(),
@@ -57,4 +60,5 @@ def get_settings() -> Settings:
         max_memories_to_scan=int(os.getenv("MAX_MEMORIES_TO_SCAN", "250")),
         primary_user_id=os.getenv("PRIMARY_USER_ID", "Matan primary user").strip(),
         single_user_mode=single_user_mode_value in {"1", "true", "yes", "on"},
+        thread_pool_size=int(os.getenv("BENJAMIN_THREAD_POOL_SIZE", "64")),
     )
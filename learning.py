@@ -8,6 +8,10 @@ from pydantic import BaseModel, Field
 from prompts import build_learning_input
 
 
+GOAL_PATTERN = re.compile(r"(?:אני רוצה|i want to|אני מחפש|i'm looking for)\s+(.+)", re.IGNORECASE)
+PROJECT_PATTERN = re.compile(r"(?:אני מתחיל|i am starting|i'm building|אני בונה)\s+(.+)", re.IGNORECASE)
+
+
 class PreferencePatch(BaseModel):
     language: str | None = None
     response_style: list[str] = Field(default_factory=list)
@@ -53,10 +57,9 @@ class LearningResult(BaseModel):
 
 
 class LearningEngine:
-    def __init__(self, client, model: str, timeout_seconds: float):
+    def __init__(self, client, model: str):
         self.client = client
         self.model = model
-        self.timeout_seconds = timeout_seconds
 
     def learn(
         self,
@@ -67,9 +70,10 @@ class LearningEngine:
         assistant_response: str,
     ) -> LearningResult:
         try:
-            response = self.client.with_options(timeout=self.timeout_seconds).responses.parse(
+            response = self.client.responses.parse(
                 model=self.model,
                 reasoning={"effort": "low"},
+                prompt_cache_key="benjamin-learning",
                 input=build_learning_input(
                     profile_summary=profile_summary,
                     recent_conversation=recent_conversation,
@@ -90,49 +94,29 @@ class LearningEngine:
         lowered = text.casefold()
         result = LearningResult()
 
-        goal_patterns = [
-            r"אני רוצה\s+(.+)",
-            r"i want to\s+(.+)",
-            r"אני מחפש\s+(.+)",
-            r"i'm looking for\s+(.+)",
-        ]
-        for pattern in goal_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                captured = match.group(1).strip(" .")
-                if captured:
-                    result.profile_updates.goals.append(captured)
-                    result.memories.append(
-                        LearnedMemory(
-                            category="goal",
-                            content=captured,
-                            confidence=0.73,
-                            importance=0.74,
-                        )
-                    )
-                break
-
-        project_patterns = [
-            r"אני מתחיל\s+(.+)",
-            r"i am starting\s+(.+)",
-            r"i'm building\s+(.+)",
-            r"אני בונה\s+(.+)",
-        ]
-        for pattern in project_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                captured = match.group(1).strip(" .")
-                if captured:
-                    result.profile_updates.projects.append(captured)
-                    result.memories.append(
-                        LearnedMemory(
-                            category="project",
-                            content=captured,
-                            confidence=0.76,
-                            importance=0.72,
-                        )
-                    )
-                break
+        goal = self._capture(GOAL_PATTERN, text)
+        if goal:
+            result.profile_updates.goals.append(goal)
+            result.memories.append(
+                LearnedMemory(
+                    category="goal",
+                    content=goal,
+                    confidence=0.73,
+                    importance=0.74,
+                )
+            )
+
+        project = self._capture(PROJECT_PATTERN, text)
+        if project:
+            result.profile_updates.projects.append(project)
+            result.memories.append(
+                LearnedMemory(
+                    category="project",
+                    content=project,
+                    confidence=0.76,
+                    importance=0.72,
+                )
+            )
 
         if "מתלבט" in text or "can't decide" in lowered or "cannot decide" in lowered:
             result.profile_updates.struggles.append("currently dealing with indecision")
@@ -179,3 +163,10 @@ class LearningEngine:
             )
 
         return result
+
+    @staticmethod
+    def _capture(pattern: re.Pattern[str], text: str) -> str | None:
+        match = pattern.search(text)
+        if not match:
+            return None
+        return match.group(1).strip(" .") or None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import re
@@ -14,6 +15,8 @@ from user_model import apply_seed_defaults, merge_user_model, seed_memories, see
 
 
 WORD_RE = re.compile(r"[\w\u0590-\u05ff]{2,}", re.UNICODE)
+MEMORY_COLUMNS = "id, category, key, content, confidence, importance, metadata_json, created_at, updated_at"
+BUSY_TIMEOUT_SECONDS = 6.0
 
 
 def utcnow_iso() -> str:
@@ -24,7 +27,12 @@ def tokenize(text: str) -> set[str]:
     return {match.group(0).casefold() for match in WORD_RE.finditer(text or "")}
 
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def tokenize_cached(text: str) -> frozenset[str]:
+    return frozenset(tokenize(text))
+
+
+@dataclass(slots=True)
 class MemoryRecord:
     id: int
     category: str
@@ -43,10 +51,14 @@ class SQLiteMemoryStore:
         self.primary_user_id = primary_user_id
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
-        self._conn = sqlite3.connect(self.database_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
+        self._conn = sqlite3.connect(
+            self.database_path,
+            timeout=BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+        )
         self._initialize()
         self._seed_primary_user()
+        self._refresh_statistics()
 
     def ensure_user(self, user_id: str, display_name: str | None = None) -> dict[str, Any]:
         with self._lock:
@@ -66,13 +78,14 @@ class SQLiteMemoryStore:
             return profile
 
     def get_user_model(self, user_id: str) -> dict[str, Any] | None:
-        row = self._conn.execute(
-            "SELECT profile_json FROM users WHERE user_id = ?",
-            (user_id,),
-        ).fetchone()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT profile_json FROM users WHERE user_id = ?",
+                (user_id,),
+            ).fetchone()
         if not row:
             return None
-        return json.loads(row["profile_json"])
+        return json.loads(row[0])
 
     def update_user_model(self, user_id: str, updates: dict[str, Any]) -> dict[str, Any]:
         with self._lock:
@@ -109,28 +122,30 @@ class SQLiteMemoryStore:
 
         with self._lock:
             existing = self._conn.execute(
-                "SELECT id, confidence, importance, metadata_json FROM memories WHERE fingerprint = ?",
+                "SELECT id, confidence, importance FROM memories WHERE fingerprint = ?",
                 (normalized,),
             ).fetchone()
             if existing:
-                merged_metadata = self._merge_metadata(existing["metadata_json"], metadata_json)
+                existing_id, existing_confidence, existing_importance = existing
+                # json_patch follows RFC 7396: null values delete keys and nested objects merge recursively.
                 self._conn.execute(
                     """
                     UPDATE memories
-                    SET confidence = ?, importance = ?, metadata_json = ?, updated_at = ?, last_seen_at = ?
+                    SET confidence = ?, importance = ?, metadata_json = json_patch(metadata_json, ?),
+                        updated_at = ?, last_seen_at = ?
                     WHERE id = ?
                     """,
                     (
-                        max(float(existing["confidence"]), confidence),
-                        max(float(existing["importance"]), importance),
-                        merged_metadata,
+                        max(float(existing_confidence), confidence),
+                        max(float(existing_importance), importance),
+                        metadata_json,
                         now,
                         now,
-                        existing["id"],
+                        existing_id,
                     ),
                 )
                 self._conn.commit()
-                return int(existing["id"])
+                return int(existing_id)
 
             cursor = self._conn.execute(
                 """
@@ -166,8 +181,8 @@ class SQLiteMemoryStore:
         categories: list[str] | None = None,
         scan_limit: int = 250,
     ) -> list[MemoryRecord]:
-        sql = """
-            SELECT *
+        sql = f"""
+            SELECT {MEMORY_COLUMNS}
             FROM memories
             WHERE user_id = ?
         """
@@ -178,16 +193,19 @@ class SQLiteMemoryStore:
             params.extend(categories)
         sql += " ORDER BY importance DESC, confidence DESC, updated_at DESC LIMIT ?"
         params.append(scan_limit)
-        rows = self._conn.execute(sql, params).fetchall()
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
         query_tokens = tokenize(query)
-        scored: list[tuple[float, sqlite3.Row]] = []
+        folded_query = query.casefold() if query else ""
+        scored: list[tuple[float, tuple[Any, ...]]] = []
         for row in rows:
-            content_tokens = tokenize(row["content"])
+            memory_id, category, key, content, confidence, importance, metadata_json, created_at, updated_at = row
+            content_tokens = tokenize_cached(content)
             overlap = len(query_tokens & content_tokens)
-            exact_bonus = 1.0 if query and query.casefold() in row["content"].casefold() else 0.0
+            exact_bonus = 1.0 if folded_query and folded_query in content.casefold() else 0.0
             score = (
-                float(row["importance"]) * 2.0
-                + float(row["confidence"]) * 1.5
+                float(importance) * 2.0
+                + float(confidence) * 1.5
                 + overlap * 1.25
                 + exact_bonus
             )
@@ -198,16 +216,17 @@ class SQLiteMemoryStore:
 
     def search_memory(self, user_id: str, query: str, *, limit: int = 8) -> list[MemoryRecord]:
         pattern = f"%{query.strip()}%"
-        rows = self._conn.execute(
-            """
-            SELECT *
-            FROM memories
-            WHERE user_id = ? AND content LIKE ?
-            ORDER BY importance DESC, confidence DESC, updated_at DESC
-            LIMIT ?
-            """,
-            (user_id, pattern, limit),
-        ).fetchall()
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT {MEMORY_COLUMNS}
+                FROM memories
+                WHERE user_id = ? AND content LIKE ?
+                ORDER BY importance DESC, confidence DESC, updated_at DESC
+                LIMIT ?
+                """,
+                (user_id, pattern, limit),
+            ).fetchall()
         return [self._row_to_memory(row) for row in rows]
 
     def log_conversation(
@@ -219,39 +238,46 @@ class SQLiteMemoryStore:
         metadata: dict[str, Any] | None = None,
     ) -> int:
         now = utcnow_iso()
-        cursor = self._conn.execute(
-            """
-            INSERT INTO conversations (user_id, role, content, metadata_json, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (user_id, role, content.strip(), json.dumps(metadata or {}, ensure_ascii=False), now),
-        )
-        self._conn.commit()
-        return int(cursor.lastrowid)
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO conversations (user_id, role, content, metadata_json, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (user_id, role, content.strip(), json.dumps(metadata or {}, ensure_ascii=False), now),
+            )
+            self._conn.commit()
+            return int(cursor.lastrowid)
 
     def get_recent_conversation(self, user_id: str, *, limit: int = 10) -> list[dict[str, Any]]:
-        rows = self._conn.execute(
-            """
-            SELECT role, content, metadata_json, created_at
-            FROM conversations
-            WHERE user_id = ?
-            ORDER BY id DESC
-            LIMIT ?
-            """,
-            (user_id, limit),
-        ).fetchall()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT role, content, metadata_json, created_at
+                FROM conversations
+                WHERE user_id = ?
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (user_id, limit),
+            ).fetchall()
         result = []
-        for row in reversed(rows):
+        for role, content, metadata_json, created_at in reversed(rows):
             result.append(
                 {
-                    "role": row["role"],
-                    "content": row["content"],
-                    "metadata": json.loads(row["metadata_json"] or "{}"),
-                    "created_at": row["created_at"],
+                    "role": role,
+                    "content": content,
+                    "metadata": json.loads(metadata_json or "{}"),
+                    "created_at": created_at,
                 }
             )
         return result
 
+    def close(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+
     def _initialize(self) -> None:
         with self._lock:
             self._conn.executescript(
@@ -296,6 +322,9 @@ class SQLiteMemoryStore:
                 CREATE INDEX IF NOT EXISTS idx_memories_user_category
                 ON memories (user_id, category);
 
+                CREATE INDEX IF NOT EXISTS idx_memories_user_rank_content
+                ON memories (user_id, importance DESC, confidence DESC, updated_at DESC, content);
+
                 CREATE INDEX IF NOT EXISTS idx_conversations_user_id
                 ON conversations (user_id, id DESC);
                 """
@@ -317,7 +346,7 @@ class SQLiteMemoryStore:
                     "SELECT created_at FROM users WHERE user_id = ?",
                     (self.primary_user_id,),
                 ).fetchone()
-                created_at = created_at["created_at"] if created_at else now
+                created_at = created_at[0] if created_at else now
 
             self._conn.execute(
                 """
@@ -342,27 +371,30 @@ class SQLiteMemoryStore:
                 )
             self._conn.commit()
 
-    def _row_to_memory(self, row: sqlite3.Row) -> MemoryRecord:
+    def _refresh_statistics(self) -> None:
+        with self._lock:
+            self._conn.executescript(
+                """
+                PRAGMA analysis_limit=400;
+                ANALYZE;
+                """
+            )
+
+    def _row_to_memory(self, row: tuple[Any, ...]) -> MemoryRecord:
+        memory_id, category, key, content, confidence, importance, metadata_json, created_at, updated_at = row
         return MemoryRecord(
-            id=int(row["id"]),
-            category=row["category"],
-            content=row["content"],
-            confidence=float(row["confidence"]),
-            importance=float(row["importance"]),
-            key=row["key"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            metadata=json.loads(row["metadata_json"] or "{}"),
+            id=int(memory_id),
+            category=category,
+            content=content,
+            confidence=float(confidence),
+            importance=float(importance),
+            key=key,
+            created_at=created_at,
+            updated_at=updated_at,
+            metadata=json.loads(metadata_json or "{}"),
         )
 
     @staticmethod
     def _memory_fingerprint(user_id: str, category: str, key: str | None, content: str) -> str:
         payload = f"{user_id}|{category}|{(key or '').strip().casefold()}|{content.strip().casefold()}"
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
-    @staticmethod
-    def _merge_metadata(existing_json: str, new_json: str) -> str:
-        existing = json.loads(existing_json or "{}")
-        incoming = json.loads(new_json or "{}")
-        merged = {**existing, **incoming}
-        return json.dumps(merged, ensure_ascii=False)
@@ -26,6 +26,19 @@ Behavior rules:
 - Synthesize what matters now.
 """.strip()
 
+JUDGMENT_SYSTEM_PROMPT = (
+    "Analyze the user's latest message for response judgment. "
+    "Return only structured data. Decide the type of need, the tone, the useful truth, "
+    "the right depth, whether memory matters, and whether live/current verification is required."
+)
+
+LEARNING_SYSTEM_PROMPT = (
+    "Extract durable learning from the conversation. "
+    "Only capture information that is likely to matter later: identity facts, goals, preferences, "
+    "struggles, projects, relationship context, priorities, values, or important life updates. "
+    "Avoid duplicates, trivia, and one-off temporary details unless they affect future support."
+)
+
 
 def build_judgment_input(
     *,
@@ -37,11 +50,7 @@ def build_judgment_input(
     return [
         {
             "role": "system",
-            "content": (
-                "Analyze the user's latest message for response judgment. "
-                "Return only structured data. Decide the type of need, the tone, the useful truth, "
-                "the right depth, whether memory matters, and whether live/current verification is required."
-            ),
+            "content": JUDGMENT_SYSTEM_PROMPT,
         },
         {
             "role": "user",
@@ -65,12 +74,7 @@ def build_learning_input(
     return [
         {
             "role": "system",
-            "content": (
-                "Extract durable learning from the conversation. "
-                "Only capture information that is likely to matter later: identity facts, goals, preferences, "
-                "struggles, projects, relationship context, priorities, values, or important life updates. "
-                "Avoid duplicates, trivia, and one-off temporary details unless they affect future support."
-            ),
+            "content": LEARNING_SYSTEM_PROMPT,
         },
         {
             "role": "user",
@@ -116,28 +120,18 @@ def build_response_input(
 def format_memories(memories: list[Any]) -> str:
     if not memories:
         return "No strongly relevant stored memories."
-    lines = []
-    for memory in memories:
-        lines.append(
-            f"- [{memory.category}] {memory.content} "
-            f"(confidence={memory.confidence:.2f}, importance={memory.importance:.2f})"
-        )
-    return "\n".join(lines)
+    return "\n".join(
+        f"- [{memory.category}] {memory.content} "
+        f"(confidence={memory.confidence:.2f}, importance={memory.importance:.2f})"
+        for memory in sorted(memories, key=lambda memory: memory.id)
+    )
 
 
 def format_conversation(conversation: list[dict[str, Any]]) -> str:
     if not conversation:
         return "No recent conversation."
-    lines = []
-    for item in conversation:
-        role = item["role"]
-        content = item["content"]
-        lines.append(f"{role}: {content}")
-    return "\n".join(lines)
+    return "\n".join(f"{item['role']}: {item['content']}" for item in conversation)
 
 
 def _format_judgment(judgment: dict[str, Any]) -> str:
-    lines = []
-    for key, value in judgment.items():
-        lines.append(f"{key}: {value}")
-    return "\n".join(lines)
+    return "\n".join(f"{key}: {value}" for key, value in judgment.items())